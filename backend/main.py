@@ -1,16 +1,28 @@
 from fastapi import FastAPI, HTTPException, File, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from pathlib import Path
+import asyncio
+import errno
+import io
 import os
+import re
 import shutil
-from typing import List, Dict, Any
-import uuid
+import stat
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
 
-app = FastAPI(title="Photo Map Organizer API", version="1.0.0")
+# Encode responses with orjson when it is installed, stdlib json otherwise
+try:
+    import orjson  # noqa: F401
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
+app = FastAPI(title="Photo Map Organizer API", version="1.0.0", default_response_class=DEFAULT_RESPONSE_CLASS)
 
 # Enable CORS for frontend integration
 app.add_middleware(
@@ -23,12 +35,31 @@ app.add_middleware(
 
 # Base path configuration - ADJUST BASED ON MY ENV
 BASE_PATH = Path("/content")
+# String form for building per-request paths without constructing Path objects
+_BASE_STR = str(BASE_PATH)
 
 # Mount static files to serve images
 if not (BASE_PATH / "static").exists():
     (BASE_PATH / "static").mkdir(parents=True, exist_ok=True)
 app.mount("/static", StaticFiles(directory=str(BASE_PATH / "static")), name="static")
 
+# File suffixes listed as images, in both common cases so most names match without lower()
+_IMAGE_SUFFIXES_LOWER = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")
+IMAGE_SUFFIXES = _IMAGE_SUFFIXES_LOWER + tuple(suffix.upper() for suffix in _IMAGE_SUFFIXES_LOWER)
+
+# Copy buffer for saving uploads; large photos benefit from bigger chunks than the 64 KiB default
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Temporary names used by sortDate between its two rename phases: .sorting_<n>_<original name>
+_SORTING_TEMP_NAME = re.compile(r"\.sorting_\d+_(.+)\Z", re.DOTALL)
+
+# os.link failures for which moveFolder falls back to shutil.move
+_LINK_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP})
+
+# In-memory pin listing, rebuilt only when the folder tree changes
+_pin_cache: Dict[str, Any] = {"key": None, "pins": None}
+_pin_cache_version = 0
+
 # Pydantic models for request/response validation
 class FolderRequest(BaseModel):
     country: str
@@ -90,7 +121,8 @@ async def create_folder(request: FolderRequest):
         raise HTTPException(status_code=500, detail=f"Failed to create folder: {str(e)}")
 
 
-@app.get("/api/get-images/{year}/{country}/{city}", response_model=List[ImageResponse])
+# Listing endpoints return plain dicts; the models only document the response schema
+@app.get("/api/get-images/{year}/{country}/{city}", responses={200: {"model": List[ImageResponse]}})
 async def get_images(year: int, country: str, city: str):
     """
     Retrieves all images from a specific location and year folder.
@@ -99,7 +131,7 @@ async def get_images(year: int, country: str, city: str):
         country: The country name
         city: The city name
     Returns:
-        List of ImageResponse objects with metadata
+        List of ImageResponse dictionaries with metadata
     """
     try:
         images = viewFolder(country, city, year)
@@ -118,7 +150,8 @@ async def move_image(request: MoveImageRequest):
         Success response with move operation details
     """
     try:
-        moveFolder(request.imageId, request.country, request.city, request.year, request.sourceFolder)
+        destination_folder = f"{_BASE_STR}/{request.year}/{request.country}/{request.city}"
+        moveFolder(request.imageId, destination_folder, request.sourceFolder)
         return {
             "success": True,
             "message": f"Successfully moved {request.imageId} to {request.city}, {request.country} ({request.year})"
@@ -139,15 +172,14 @@ async def sort_folder_by_date(request: FolderRequest):
         Success response with sorting details
     """
     try:
-        folder_path = BASE_PATH / str(request.year) / request.country / request.city
-        if not folder_path.exists():
-            raise HTTPException(status_code=404, detail="Folder not found")
-        
-        sortDate(str(folder_path))
+        folder_path = f"{_BASE_STR}/{request.year}/{request.country}/{request.city}"
+        sortDate(folder_path)
         return {
             "success": True,
             "message": f"Successfully sorted images in {request.city}, {request.country} ({request.year})"
         }
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Folder not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to sort folder: {str(e)}")
 
@@ -173,16 +205,18 @@ async def upload_images(
         # Create folder if it doesn't exist
         folder_path = makeFolder(country, city, year)
         uploaded_files = []
+        saves = []
         
         for file in files:
             # Generate unique filename to avoid conflicts
-            file_extension = Path(file.filename).suffix
-            unique_filename = f"{uuid.uuid4().hex}{file_extension}"
+            name = file.filename or ""
+            dot = name.rfind(".")
+            file_extension = name[dot:] if name.rfind("/") + 1 < dot < len(name) - 1 else ""
+            unique_filename = f"{os.urandom(16).hex()}{file_extension}"
             file_path = folder_path / unique_filename
             
-            # Save uploaded file
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # Save uploaded file off the event loop
+            saves.append(asyncio.to_thread(_save_upload, file.file, file_path))
             
             uploaded_files.append({
                 "original_name": file.filename,
@@ -190,6 +224,14 @@ async def upload_images(
                 "path": str(file_path)
             })
         
+        # Wait for every save, even after one fails, so the caches are only cleared once
+        # nothing is still being written; a failed batch can still leave some files saved
+        results = await asyncio.gather(*saves, return_exceptions=True)
+        _view_folder_cached.cache_clear()
+        _invalidate_pin_cache()
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         return {
             "success": True,
             "message": f"Successfully uploaded {len(files)} images to {city}, {country} ({year})",
@@ -199,44 +241,31 @@ async def upload_images(
         raise HTTPException(status_code=500, detail=f"Failed to upload images: {str(e)}")
 
 
-@app.get("/api/get-all-pins", response_model=List[PinData])
+@app.get("/api/get-all-pins", responses={200: {"model": List[PinData]}})
 async def get_all_pins():
     """
     Retrieves all location pins with their image counts.
     Returns:
-        List of PinData objects representing all locations with photos
+        List of PinData dictionaries representing all locations with photos
     """
     try:
-        pins = []
-        if not BASE_PATH.exists():
-            return pins
-        
-        # Traverse the directory structure to find all locations
-        for year_dir in BASE_PATH.iterdir():
-            if year_dir.is_dir() and year_dir.name.isdigit():
-                year = int(year_dir.name)
-                for country_dir in year_dir.iterdir():
-                    if country_dir.is_dir():
-                        country = country_dir.name
-                        for city_dir in country_dir.iterdir():
-                            if city_dir.is_dir():
-                                city = city_dir.name
-                                # Count images in this location
-                                image_count = len([f for f in city_dir.iterdir() if f.is_file()])
-                                
-                                # Generate a unique ID for this pin
-                                pin_id = f"{country}_{city}_{year}".replace(" ", "_")
-                                
-                                pins.append(PinData(
-                                    id=pin_id,
-                                    country=country,
-                                    city=city,
-                                    lat=0.0,  # You'll need to add geocoding for real coordinates
-                                    lng=0.0,  # You'll need to add geocoding for real coordinates
-                                    year=year,
-                                    imageCount=image_count
-                                ))
-        return pins
+        # Reuse the last listing while the tree is unchanged; the top-level listing and
+        # stats run in a worker thread too, so a slow (e.g. network) mount never blocks the loop
+        try:
+            year_folders, key = await asyncio.to_thread(_pin_cache_state)
+        except FileNotFoundError:
+            return []
+        # Concurrent rebuilds may interleave across the awaits below; that is safe because
+        # the key was read before the scan, so a change made mid-scan only makes it stale
+        if _pin_cache["key"] != key:
+            # Scan each year's subtree in a worker thread so directory reads overlap
+            results = await asyncio.gather(*[
+                asyncio.to_thread(scanYear, year_path, year)
+                for year, year_path, _ in year_folders
+            ])
+            _pin_cache["pins"] = [pin for year_pins in results for pin in year_pins]
+            _pin_cache["key"] = key
+        return list(_pin_cache["pins"])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve pins: {str(e)}")
 
@@ -254,11 +283,15 @@ async def serve_image(year: int, country: str, city: str, filename: str):
         FileResponse with the requested image
     """
     try:
-        file_path = BASE_PATH / str(year) / country / city / filename
-        if not file_path.exists():
-            raise HTTPException(status_code=404, detail="Image not found")
-        
-        return FileResponse(str(file_path))
+        file_path = f"{_BASE_STR}/{year}/{country}/{city}/{filename}"
+        # Hand the stat result to FileResponse so the file is only stat-ed once per request;
+        # it then skips its own regular-file check, so do that here
+        stat_result = os.stat(file_path)
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise FileNotFoundError(file_path)
+        return FileResponse(file_path, stat_result=stat_result)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Image not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to serve image: {str(e)}")
 
@@ -266,6 +299,141 @@ async def serve_image(year: int, country: str, city: str, filename: str):
 
 # Implementation of backend python utility functions****************************************
 
+def scanYear(year_path: str, year: int) -> List[Dict[str, Any]]:
+    """
+    Walks the country/city folders of one year and builds a pin for every location.
+    Args:
+        year_path: The path to the year folder
+        year: The year
+    Returns:
+        A list of dictionaries in the PinData shape for the locations with photos in that year
+    """
+    pins = []
+    # Nested scandir reads each directory exactly once and reuses the entry type from
+    # the listing instead of stat-ing each entry
+    with os.scandir(year_path) as countries:
+        for country_dir in countries:
+            if not country_dir.is_dir(follow_symlinks=False):
+                continue
+            country = country_dir.name
+            with os.scandir(country_dir.path) as cities:
+                for city_dir in cities:
+                    if not city_dir.is_dir(follow_symlinks=False):
+                        continue
+                    city = city_dir.name
+                    # Count images in this location
+                    with os.scandir(city_dir.path) as entries:
+                        image_count = sum(1 for e in entries if e.is_file(follow_symlinks=False))
+
+                    # Generate a unique ID for this pin
+                    pin_id = f"{country}_{city}_{year}".replace(" ", "_")
+
+                    pins.append({
+                        "id": pin_id,
+                        "country": country,
+                        "city": city,
+                        "lat": 0.0,  # You'll need to add geocoding for real coordinates
+                        "lng": 0.0,  # You'll need to add geocoding for real coordinates
+                        "year": year,
+                        "imageCount": image_count
+                    })
+    pins.sort(key=lambda pin: (pin["country"], pin["city"]))
+    return pins
+
+
+def _year_folders() -> List[tuple]:
+    """
+    Lists the year folders directly under BASE_PATH.
+    Returns:
+        Sorted list of (year, path, mtime_ns) tuples
+    """
+    year_folders = []
+    with os.scandir(BASE_PATH) as years:
+        for year_dir in years:
+            try:
+                year = int(year_dir.name)
+            except ValueError:
+                continue
+            # int() also accepts names like " 2020", "+2020", "2_020" or "-1"; the other
+            # endpoints rebuild the folder path as str(year), so only canonical digit-only
+            # names count, as with the isdigit() check this replaced
+            if year >= 0 and str(year) == year_dir.name and year_dir.is_dir(follow_symlinks=False):
+                year_folders.append((
+                    year,
+                    year_dir.path,
+                    year_dir.stat(follow_symlinks=False).st_mtime_ns
+                ))
+    year_folders.sort()
+    return year_folders
+
+
+def _pin_cache_state() -> Tuple[List[tuple], tuple]:
+    """
+    Lists the year folders and builds the validation key for the cached pin listing
+    from the cache version and the modification times of BASE_PATH and every year folder.
+    Changes made through the API bump the version. A directory's mtime only covers its
+    own entries, so photos or city folders added or removed outside the API (e.g. copied
+    into BASE_PATH directly) are not seen until a year folder or the version changes.
+    Raises FileNotFoundError if BASE_PATH does not exist.
+    Returns:
+        (year_folders, key) tuple
+    """
+    # Read the version and BASE_PATH mtime before listing, so a change made during
+    # the listing leaves the key stale rather than the cached pins
+    version = _pin_cache_version
+    base_mtime_ns = os.stat(BASE_PATH).st_mtime_ns
+    year_folders = _year_folders()
+    year_mtimes = tuple((year, mtime_ns) for year, _, mtime_ns in year_folders)
+    return year_folders, (version, base_mtime_ns, year_mtimes)
+
+
+def _invalidate_pin_cache() -> None:
+    """Forces the next get_all_pins call to rescan the folder structure."""
+    global _pin_cache_version
+    _pin_cache_version += 1
+
+
+def _save_upload(src_fileobj, dest_path: Path) -> None:
+    """
+    Writes an uploaded file to disk. Runs in a worker thread so the event loop stays free.
+    Args:
+        src_fileobj: The file object of the upload
+        dest_path: The path the upload is saved to
+    """
+    with open(dest_path, "wb") as buffer:
+        # Uploads backed by a real file can be copied in-kernel; in-memory spools,
+        # other file objects and platforms without sendfile take the buffered copy.
+        # SpooledTemporaryFile keeps its current storage in _file (BytesIO until it rolls over)
+        src_file = getattr(src_fileobj, "_file", src_fileobj)
+        if hasattr(os, "sendfile") and isinstance(src_file, (io.BufferedRandom, io.BufferedReader)):
+            try:
+                _sendfile_copy(src_fileobj, buffer)
+                return
+            except OSError:
+                buffer.seek(0)
+                buffer.truncate()
+        shutil.copyfileobj(src_fileobj, buffer, length=UPLOAD_CHUNK_SIZE)
+
+
+def _sendfile_copy(src_fileobj, dest_fileobj) -> None:
+    """
+    Copies the rest of src_fileobj into dest_fileobj with os.sendfile, without
+    moving the data through user space. The source position is left unchanged.
+    Args:
+        src_fileobj: A file object backed by a real file descriptor
+        dest_fileobj: The destination file object opened for writing
+    """
+    src_fileobj.flush()
+    src_fd = src_fileobj.fileno()
+    offset = src_fileobj.tell()
+    end = os.fstat(src_fd).st_size
+    while offset < end:
+        sent = os.sendfile(dest_fileobj.fileno(), src_fd, offset, end - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+
 def makeFolder(country: str, city: str, year: int) -> Path:
     """
     Creates a nested folder structure within the specified environment.
@@ -278,6 +446,7 @@ def makeFolder(country: str, city: str, year: int) -> Path:
     """
     folder_path = BASE_PATH / str(year) / country / city
     folder_path.mkdir(parents=True, exist_ok=True)
+    _invalidate_pin_cache()
     return folder_path
 
 
@@ -288,27 +457,106 @@ def sortDate(path: str) -> None:
     Args:
         path: The path to the directory containing the files
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Directory {path} does not exist")
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Directory {path} does not exist") from None
     
-    files = [f for f in path.iterdir() if f.is_file()]
-    files.sort(key=lambda x: os.path.getmtime(x))
-
-    # Rename files with a numerical prefix to reflect the sorted order
-    for i, old_file_path in enumerate(files):
-        # Skip files that already have the naming convention
-        if not old_file_path.name.startswith(f"{i+1:03d}_"):
-            new_file_name = f"{i+1:03d}_{old_file_path.name}"
-            new_file_path = path / new_file_name
-            # Handle naming conflicts
-            counter = 1
-            while new_file_path.exists():
-                new_file_name = f"{i+1:03d}_{counter}_{old_file_path.name}"
-                new_file_path = path / new_file_name
-                counter += 1
-            
-            os.rename(old_file_path, new_file_path)
+    # Collect every name plus (mtime, name) for files in a single directory pass
+    existing_names = set()
+    files = []
+    leftovers = []
+    with entries:
+        for entry in entries:
+            existing_names.add(entry.name)
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            # Files still under a temporary name from an interrupted sort are restored, not sorted
+            match = _SORTING_TEMP_NAME.match(entry.name)
+            if match:
+                leftovers.append((entry.name, match.group(1)))
+            else:
+                files.append((entry.stat(follow_symlinks=False).st_mtime_ns, entry.name))
+
+    for tmp_name, old_name in leftovers:
+        if old_name not in existing_names and _restore_sorting_temp(path, tmp_name, old_name):
+            existing_names.discard(tmp_name)
+            existing_names.add(old_name)
+            files.append((os.stat(f"{path}/{old_name}").st_mtime_ns, old_name))
+    files.sort()
+
+    # Files that already carry their prefix keep their name; the rest are renamed
+    pending = [
+        (i, old_name) for i, (_, old_name) in enumerate(files)
+        if not old_name.startswith(f"{i+1:03d}_")
+    ]
+
+    for _, old_name in pending:
+        existing_names.discard(old_name)
+
+    # Work out and check every temporary and final name before touching the folder, so a
+    # name that cannot be created fails the sort while all files keep their original names.
+    # Temporary names embed the original name so an interrupted sort can be recovered
+    name_max = os.pathconf(path, "PC_NAME_MAX") if hasattr(os, "pathconf") else 255
+    planned = []
+    for i, old_name in pending:
+        n = i
+        while f".sorting_{n}_{old_name}" in existing_names:
+            n += 1
+        tmp_name = f".sorting_{n}_{old_name}"
+        new_file_name = f"{i+1:03d}_{old_name}"
+        counter = 1
+        while new_file_name in existing_names:
+            new_file_name = f"{i+1:03d}_{counter}_{old_name}"
+            counter += 1
+        for name in (tmp_name, new_file_name):
+            if len(os.fsencode(name)) > name_max:
+                raise OSError(errno.ENAMETOOLONG, os.strerror(errno.ENAMETOOLONG), name)
+        existing_names.add(tmp_name)
+        existing_names.add(new_file_name)
+        planned.append((tmp_name, old_name, new_file_name))
+
+    # Phase 1 moves pending files out of the way under temporary names, so the final
+    # names in phase 2 cannot collide with a file that is still waiting to be renamed
+    moved = renamed = 0
+    try:
+        for tmp_name, old_name, _ in planned:
+            os.rename(f"{path}/{old_name}", f"{path}/{tmp_name}")
+            moved += 1
+
+        # Phase 2: rename each file to its numerical prefix in sorted order
+        for tmp_name, _, new_file_name in planned:
+            os.rename(f"{path}/{tmp_name}", f"{path}/{new_file_name}")
+            renamed += 1
+    except OSError:
+        # Put files still under a temporary name back under their original name. A name
+        # already taken by a renamed file is never overwritten; the file then stays under
+        # its temporary name, which the next sort restores once the name is free
+        for tmp_name, old_name, _ in planned[renamed:moved]:
+            _restore_sorting_temp(path, tmp_name, old_name)
+        raise
+
+
+def _restore_sorting_temp(path: str, tmp_name: str, old_name: str) -> bool:
+    """
+    Moves a file left under a sortDate temporary name back to its original name.
+    Uses link + unlink because, unlike os.rename, os.link never replaces an existing file.
+    Args:
+        path: The directory containing the file
+        tmp_name: The temporary name the file currently has
+        old_name: The original name to restore
+    Returns:
+        True if the file was restored, False if it was left under its temporary name
+    """
+    try:
+        os.link(f"{path}/{tmp_name}", f"{path}/{old_name}", follow_symlinks=False)
+    except OSError:
+        return False
+    try:
+        os.unlink(f"{path}/{tmp_name}")
+    except OSError:
+        pass
+    return True
 
 
 def moveFolder(imageId: str, destination_folder: str, sourceFolder: str) -> None:
@@ -319,27 +567,45 @@ def moveFolder(imageId: str, destination_folder: str, sourceFolder: str) -> None
         destination_folder: The path to the destination folder where the image is retrieved
         sourceFolder: The path to the source folder where the image is located
     """
-    source_path = Path(sourceFolder) / imageId
+    source_path = f"{sourceFolder}/{imageId}"
+    stem, suffix = os.path.splitext(imageId)
     
     # Create destination folder if it doesn't exist
-    if not destination_folder.exists():
-        destination_folder.mkdir(parents=True, exist_ok=True)
+    os.makedirs(destination_folder, exist_ok=True)
     
-    destination_path = destination_folder / imageId
+    destination_path = f"{destination_folder}/{imageId}"
     
-    # Handle naming conflicts
+    # Same-filesystem fast path: hard-link under a free name, then drop the source.
+    # Unlike os.rename, os.link never overwrites, so naming conflicts show up as
+    # FileExistsError instead of needing an exists() probe per candidate name
     counter = 1
-    while destination_path.exists():
-        name_parts = Path(imageId).stem, Path(imageId).suffix
-        new_name = f"{name_parts[0]}_{counter}{name_parts[1]}"
-        destination_path = destination_folder / new_name
-        counter += 1
-    
-    # Move the file
-    if not source_path.exists():
-        raise FileNotFoundError(f"Source file '{imageId}' not found in '{sourceFolder}'")
-    
-    shutil.move(str(source_path), str(destination_path))
+    while True:
+        try:
+            os.link(source_path, destination_path, follow_symlinks=False)
+        except FileExistsError:
+            destination_path = f"{destination_folder}/{stem}_{counter}{suffix}"
+            counter += 1
+            continue
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Source file '{imageId}' not found in '{sourceFolder}'") from None
+        except OSError as e:
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                raise
+            # Cross-device move or no hard-link support: copy and delete instead
+            while os.path.exists(destination_path):
+                destination_path = f"{destination_folder}/{stem}_{counter}{suffix}"
+                counter += 1
+            shutil.move(source_path, destination_path)
+            break
+        try:
+            os.unlink(source_path)
+        except OSError:
+            # Leave the image only in its source folder rather than in both
+            os.unlink(destination_path)
+            raise
+        break
+    _view_folder_cached.cache_clear()
+    _invalidate_pin_cache()
 
 
 def viewFolder(country: str, city: str, year: int) -> List[Dict[str, Any]]:
@@ -352,27 +618,56 @@ def viewFolder(country: str, city: str, year: int) -> List[Dict[str, Any]]:
     Returns:
         A list of dictionaries representing images with metadata
     """
-    folder_path = BASE_PATH / str(year) / country / city
+    folder_path = f"{_BASE_STR}/{year}/{country}/{city}"
+    # Any change to the folder's entries bumps its mtime, which invalidates the cached listing
+    try:
+        mtime_ns = os.stat(folder_path).st_mtime_ns
+        return list(_view_folder_cached(country, city, year, mtime_ns))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+@lru_cache(maxsize=512)
+def _view_folder_cached(country: str, city: str, year: int, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:
+    """
+    Scans a location folder for images. Memoized on the folder's mtime_ns by viewFolder.
+    The folder mtime only changes when entries are added, removed or renamed, so a file
+    rewritten in place keeps its old file_size here until the cache is cleared;
+    upload_images and moveFolder clear it after writing.
+    Args:
+        country: The country name
+        city: The city name
+        year: The year
+        mtime_ns: The folder's modification time, used only as part of the cache key
+    Returns:
+        A tuple of dictionaries representing images with metadata
+    """
+    folder_path = f"{_BASE_STR}/{year}/{country}/{city}"
     image_list = []
 
-    if folder_path.exists() and folder_path.is_dir():
-        for file_path in folder_path.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']:
-                # Get file stats
-                stats = file_path.stat()
-                created_time = datetime.fromtimestamp(stats.st_mtime).isoformat()
-                
-                image_list.append({
-                    "id": file_path.name,
-                    "name": file_path.name,
-                    "url": f"/api/serve-image/{year}/{country}/{city}/{file_path.name}",
-                    "year": year,
-                    "location": city,
-                    "file_size": stats.st_size,
-                    "created_at": created_time
-                })
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            name = entry.name
+            # Only names that miss the fast check (mixed case or non-images) get lowercased
+            if not (name.endswith(IMAGE_SUFFIXES) or name.lower().endswith(_IMAGE_SUFFIXES_LOWER)):
+                continue
+            # Get file stats
+            stats = entry.stat(follow_symlinks=False)
+            created_time = datetime.fromtimestamp(stats.st_mtime).isoformat()
+            
+            image_list.append({
+                "id": name,
+                "name": name,
+                "url": f"/api/serve-image/{year}/{country}/{city}/{name}",
+                "year": year,
+                "location": city,
+                "file_size": stats.st_size,
+                "created_at": created_time
+            })
     
-    return image_list
+    return tuple(image_list)
 
 
 if __name__ == "__main__":
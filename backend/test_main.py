@@ -0,0 +1,99 @@
+import asyncio
+import errno
+import os
+
+import pytest
+
+import main
+
+
+def _make_files(folder, names):
+    """Creates files with increasing mtimes, each containing its own name."""
+    for i, name in enumerate(names):
+        file_path = folder / name
+        file_path.write_text(name)
+        os.utime(file_path, ns=(i * 10**9, i * 10**9))
+
+
+def _contents(folder):
+    return {p.name: p.read_text() for p in folder.iterdir()}
+
+
+def test_sort_date_failed_rename_never_overwrites_a_file(tmp_path, monkeypatch):
+    # "y" is renamed to "001_y", which is the original name of the second file
+    _make_files(tmp_path, ["y", "001_y"])
+
+    real_rename = os.rename
+    calls = []
+
+    def failing_rename(src, dst):
+        calls.append(src)
+        if len(calls) == 4:
+            raise OSError(errno.EIO, "injected failure")
+        return real_rename(src, dst)
+
+    monkeypatch.setattr(main.os, "rename", failing_rename)
+    with pytest.raises(OSError):
+        main.sortDate(str(tmp_path))
+    monkeypatch.undo()
+
+    # Both photos survive; the one whose name was taken stays under a temporary name
+    contents = _contents(tmp_path)
+    assert sorted(contents.values()) == ["001_y", "y"]
+    assert contents["001_y"] == "y"
+
+    # A later sort neither loses nor prefixes the leftover temporary file
+    main.sortDate(str(tmp_path))
+    contents = _contents(tmp_path)
+    assert sorted(contents.values()) == ["001_y", "y"]
+    assert not any(name[3:].startswith("_.sorting_") for name in contents)
+
+
+def test_sort_date_restores_files_left_by_an_interrupted_sort(tmp_path):
+    _make_files(tmp_path, ["a.jpg", ".sorting_1_b.jpg"])
+
+    main.sortDate(str(tmp_path))
+
+    assert _contents(tmp_path) == {"001_a.jpg": "a.jpg", "002_b.jpg": ".sorting_1_b.jpg"}
+
+
+def test_move_folder_keeps_symlinks_and_rolls_back_failed_unlink(tmp_path, monkeypatch):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "target.jpg").write_text("photo")
+    os.symlink("target.jpg", source / "link.jpg")
+
+    main.moveFolder("link.jpg", str(tmp_path / "dest"), str(source))
+    assert os.readlink(tmp_path / "dest" / "link.jpg") == "target.jpg"
+
+    real_unlink = os.unlink
+
+    def failing_unlink(path):
+        if str(path).startswith(str(source)):
+            raise PermissionError(errno.EACCES, "injected failure", path)
+        return real_unlink(path)
+
+    monkeypatch.setattr(main.os, "unlink", failing_unlink)
+    with pytest.raises(PermissionError):
+        main.moveFolder("target.jpg", str(tmp_path / "dest"), str(source))
+    monkeypatch.undo()
+
+    assert (source / "target.jpg").read_text() == "photo"
+    assert not (tmp_path / "dest" / "target.jpg").exists()
+
+
+def test_serve_image_returns_404_for_a_directory(tmp_path, monkeypatch):
+    (tmp_path / "2020" / "France" / "Paris" / "album").mkdir(parents=True)
+    monkeypatch.setattr(main, "_BASE_STR", str(tmp_path))
+
+    with pytest.raises(main.HTTPException) as excinfo:
+        asyncio.run(main.serve_image(2020, "France", "Paris", "album"))
+    assert excinfo.value.status_code == 404
+
+
+def test_year_folders_skip_non_canonical_year_names(tmp_path, monkeypatch):
+    for name in ["2020", " 2021", "+2022", "2_023", "-1", "photos"]:
+        (tmp_path / name).mkdir()
+    monkeypatch.setattr(main, "BASE_PATH", tmp_path)
+
+    assert [year for year, _, _ in main._year_folders()] == [2020]